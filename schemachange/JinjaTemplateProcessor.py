@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from pathlib import Path
 from typing import Any
 
@@ -12,6 +13,23 @@ from schemachange.JinjaEnvVar import JinjaEnvVar
 
 logger = structlog.getLogger(__name__)
 
+# Jinja only changes text around its block, variable and comment delimiters
+jinja_markers = ("{%", "{{", "{#")
+# Jinja normalizes all line endings to \n
+newline_pattern = re.compile(r"\r\n?")
+
+
+class BestEffortBytecodeCache(jinja2.FileSystemBytecodeCache):
+    """
+    FileSystemBytecodeCache that never fails a render because the cache can't be written
+    """
+
+    def dump_bytecode(self, bucket: jinja2.bccache.Bucket) -> None:
+        try:
+            super().dump_bytecode(bucket)
+        except OSError as e:
+            logger.debug("Unable to write Jinja bytecode cache", error=str(e))
+
 
 class JinjaTemplateProcessor:
     _env_args = {
@@ -20,7 +38,13 @@ class JinjaTemplateProcessor:
         "extensions": [JinjaEnvVar],
     }
 
-    def __init__(self, project_root: Path, modules_folder: Path = None):
+    def __init__(
+        self,
+        project_root: Path,
+        modules_folder: Path = None,
+        use_bytecode_cache: bool = False,
+        schemachange_version: str | None = None,
+    ):
         loader: BaseLoader
         if modules_folder:
             loader = jinja2.ChoiceLoader(
@@ -33,7 +57,27 @@ class JinjaTemplateProcessor:
             )
         else:
             loader = jinja2.FileSystemLoader(project_root)
-        self.__environment = jinja2.Environment(loader=loader, **self._env_args)
+        # Compiled templates are persisted to the user's temp directory so that
+        # subsequent runs can skip the parse/compile step. Jinja validates the
+        # cached bytecode against the template source checksum, but not against the
+        # environment settings, so the cache files are namespaced to schemachange
+        # and its version.
+        # Only worth the cache reads and writes when rendering many scripts.
+        self.__bytecode_cache: jinja2.BytecodeCache | None = None
+        if use_bytecode_cache:
+            pattern = (
+                f"__schemachange_{schemachange_version}_%s.cache"
+                if schemachange_version
+                else "__schemachange_%s.cache"
+            )
+            try:
+                self.__bytecode_cache = BestEffortBytecodeCache(pattern=pattern)
+            except (OSError, RuntimeError) as e:
+                # The cache is only an optimization, e.g. on read-only file systems
+                logger.debug("Jinja bytecode cache disabled", error=str(e))
+        self.__environment = jinja2.Environment(
+            loader=loader, bytecode_cache=self.__bytecode_cache, **self._env_args
+        )
         self.__project_root = project_root
 
     def list(self):
@@ -41,15 +85,24 @@ class JinjaTemplateProcessor:
 
     def override_loader(self, loader: jinja2.BaseLoader):
         # to make unit testing easier
-        self.__environment = jinja2.Environment(loader=loader, **self._env_args)
+        self.__environment = jinja2.Environment(
+            loader=loader, bytecode_cache=self.__bytecode_cache, **self._env_args
+        )
 
     def render(self, script: str, variables: dict[str, Any] | None) -> str:
         if not variables:
             variables = {}
         # jinja needs posix path
         posix_path = Path(script).as_posix()
-        template = self.__environment.get_template(posix_path)
-        content = template.render(**variables).strip()
+        source, _, _ = self.__environment.loader.get_source(
+            self.__environment, posix_path
+        )
+        if any(marker in source for marker in jinja_markers):
+            template = self.__environment.get_template(posix_path)
+            content = template.render(**variables).strip()
+        else:
+            # Plain SQL renders to itself, skip compiling it as a template
+            content = newline_pattern.sub("\n", source).strip()
         content = content[:-1] if content.endswith(";") else content
         return content
 
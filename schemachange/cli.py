@@ -1,4 +1,6 @@
-import hashlib
+from __future__ import annotations
+
+import functools
 from pathlib import Path
 
 import structlog
@@ -7,9 +9,8 @@ from structlog import BoundLogger
 from schemachange.JinjaTemplateProcessor import JinjaTemplateProcessor
 from schemachange.config.RenderConfig import RenderConfig
 from schemachange.config.get_merged_config import get_merged_config
-from schemachange.deploy import deploy
 from schemachange.redact_config_secrets import redact_config_secrets
-from schemachange.session.SnowflakeSession import SnowflakeSession
+from schemachange.session.Script import get_checksum
 
 # region Global Variables
 # metadata
@@ -18,6 +19,24 @@ SNOWFLAKE_APPLICATION_NAME = "schemachange"
 module_logger = structlog.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=8)
+def _get_jinja_processor(
+    project_root: Path, modules_folder: Path | None
+) -> JinjaTemplateProcessor:
+    """
+    Returns a JinjaTemplateProcessor shared by all renders of the same project, so
+    the Jinja environment and its compiled templates are reused.
+
+    The bytecode cache is left off: render is a one-shot command, where writing the
+    cache costs more than it saves.
+    """
+    return JinjaTemplateProcessor(
+        project_root=project_root,
+        modules_folder=modules_folder,
+        use_bytecode_cache=False,
+    )
+
+
 def render(config: RenderConfig, script_path: Path, logger: BoundLogger) -> None:
     """
     Renders the provided script.
@@ -25,22 +44,19 @@ def render(config: RenderConfig, script_path: Path, logger: BoundLogger) -> None
     Note: does not apply secrets filtering.
     """
     # Always process with jinja engine
-    jinja_processor = JinjaTemplateProcessor(
+    jinja_processor = _get_jinja_processor(
         project_root=config.root_folder, modules_folder=config.modules_folder
     )
     content = jinja_processor.render(
         jinja_processor.relpath(script_path), config.config_vars
     )
 
-    checksum = hashlib.sha224(content.encode("utf-8")).hexdigest()
+    checksum = get_checksum(content)
     logger.info("Success", checksum=checksum, content=content)
 
 
 def main():
-    module_logger.info(
-        "schemachange version: %(schemachange_version)s"
-        % {"schemachange_version": SCHEMACHANGE_VERSION}
-    )
+    module_logger.info(f"schemachange version: {SCHEMACHANGE_VERSION}")
 
     config = get_merged_config(logger=module_logger)
     redact_config_secrets(config_secrets=config.secrets)
@@ -62,13 +78,21 @@ def main():
             logger=logger,
         )
     else:
+        # The Snowflake connector is slow to import, only load it when deploying
+        from schemachange.deploy import deploy
+        from schemachange.session.SnowflakeSession import SnowflakeSession
+
         session = SnowflakeSession(
             schemachange_version=SCHEMACHANGE_VERSION,
             application=SNOWFLAKE_APPLICATION_NAME,
             logger=logger,
             **config.get_session_kwargs(),
         )
-        deploy(config=config, session=session)
+        deploy(
+            config=config,
+            session=session,
+            schemachange_version=SCHEMACHANGE_VERSION,
+        )
 
 
 if __name__ == "__main__":
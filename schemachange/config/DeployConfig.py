@@ -73,23 +73,24 @@ class DeployConfig(BaseConfig):
         )
 
     def get_session_kwargs(self) -> dict:
-        session_kwargs = {
-            "account": self.snowflake_account,  # TODO: Remove when connections.toml is enforced
-            "user": self.snowflake_user,  # TODO: Remove when connections.toml is enforced
-            "role": self.snowflake_role,  # TODO: Remove when connections.toml is enforced
-            "warehouse": self.snowflake_warehouse,  # TODO: Remove when connections.toml is enforced
-            "database": self.snowflake_database,  # TODO: Remove when connections.toml is enforced
-            "schema": self.snowflake_schema,  # TODO: Remove when connections.toml is enforced
-            "connections_file_path": self.connections_file_path,
-            "connection_name": self.connection_name,
-            "change_history_table": self.change_history_table,
-            "autocommit": self.autocommit,
-            "query_tag": self.query_tag,
-        }
+        session_kwargs = (
+            # TODO: Remove account, user, role, warehouse, database and schema when connections.toml is enforced
+            ("account", self.snowflake_account),
+            ("user", self.snowflake_user),
+            ("role", self.snowflake_role),
+            ("warehouse", self.snowflake_warehouse),
+            ("database", self.snowflake_database),
+            ("schema", self.snowflake_schema),
+            ("connections_file_path", self.connections_file_path),
+            ("connection_name", self.connection_name),
+            ("change_history_table", self.change_history_table),
+            ("autocommit", self.autocommit),
+            ("query_tag", self.query_tag),
+        )
 
         # TODO: Discuss the need for check for snowflake password before passing the session
         # kwargs to open a snowflake session
         # snowflake_password = get_snowflake_password()
         # if snowflake_password is not None and snowflake_password:
         #    session_kwargs["password"] = snowflake_password
-        return {k: v for k, v in session_kwargs.items() if v is not None}
+        return {k: v for k, v in session_kwargs if v is not None}
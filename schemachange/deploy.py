@@ -1,22 +1,17 @@
 from __future__ import annotations
 
-import hashlib
 import re
 
 import structlog
 
 from schemachange.JinjaTemplateProcessor import JinjaTemplateProcessor
 from schemachange.config.DeployConfig import DeployConfig
-from schemachange.session.Script import get_all_scripts_recursively
+from schemachange.session.Script import get_all_scripts_recursively, get_checksum
 from schemachange.session.SnowflakeSession import SnowflakeSession
 
 logger = structlog.getLogger(__name__)
 
-
-def alphanum_convert(text: str):
-    if text.isdigit():
-        return int(text)
-    return text.lower()
+alphanum_pattern = re.compile(r"([0-9]+)")
 
 
 # This function will return a list containing the parts of the key (split by number parts)
@@ -26,15 +21,15 @@ def alphanum_convert(text: str):
 def get_alphanum_key(key: str | int | None) -> list:
     if key == "" or key is None:
         return []
-    alphanum_key = [alphanum_convert(c) for c in re.split("([0-9]+)", key)]
-    return alphanum_key
-
-
-def sorted_alphanumeric(data):
-    return sorted(data, key=get_alphanum_key)
+    # Splitting on a capturing group alternates text and number parts, so the number
+    # parts are at the odd indexes and don't need an isdigit check
+    return [
+        int(part) if i % 2 else part.lower()
+        for i, part in enumerate(alphanum_pattern.split(key))
+    ]
 
 
-def deploy(config: DeployConfig, session: SnowflakeSession):
+def deploy(config: DeployConfig, session: SnowflakeSession, schemachange_version: str):
     logger.info(
         "starting deploy",
         dry_run=config.dry_run,
@@ -61,16 +56,30 @@ def deploy(config: DeployConfig, session: SnowflakeSession):
     all_scripts = get_all_scripts_recursively(
         root_directory=config.root_folder,
     )
-    all_script_names = list(all_scripts.keys())
+    # Bucket the script names by type in a single pass, using the first character of the
+    # lower case name. Names that don't start with a script type (e.g. a leading space)
+    # are skipped.
+    script_names_by_type: dict[str, list[str]] = {"v": [], "r": [], "a": []}
+    for script_name in all_scripts:
+        bucket = script_names_by_type.get(script_name[0])
+        if bucket is not None:
+            bucket.append(script_name)
     # Sort scripts such that versioned scripts get applied first and then the repeatable ones.
-    all_script_names_sorted = (
-        sorted_alphanumeric([script for script in all_script_names if script[0] == "v"])
-        + sorted_alphanumeric(
-            [script for script in all_script_names if script[0] == "r"]
-        )
-        + sorted_alphanumeric(
-            [script for script in all_script_names if script[0] == "a"]
-        )
+    # The buckets are sorted in place, they aren't used for anything else.
+    for script_names in script_names_by_type.values():
+        script_names.sort(key=get_alphanum_key)
+    all_script_names_sorted = [
+        *script_names_by_type["v"],
+        *script_names_by_type["r"],
+        *script_names_by_type["a"],
+    ]
+
+    # The root and modules folders are the same for every script, share one environment
+    jinja_processor = JinjaTemplateProcessor(
+        project_root=config.root_folder,
+        modules_folder=config.modules_folder,
+        use_bytecode_cache=True,
+        schemachange_version=schemachange_version,
     )
 
     scripts_skipped = 0
@@ -86,15 +95,12 @@ def deploy(config: DeployConfig, session: SnowflakeSession):
             script_version=getattr(script, "version", "N/A"),
         )
         # Always process with jinja engine
-        jinja_processor = JinjaTemplateProcessor(
-            project_root=config.root_folder, modules_folder=config.modules_folder
-        )
         content = jinja_processor.render(
             jinja_processor.relpath(script.file_path),
             config.config_vars,
         )
 
-        checksum_current = hashlib.sha224(content.encode("utf-8")).hexdigest()
+        checksum_current = get_checksum(content)
 
         # Apply a versioned-change script only if the version is newer than the most recent change in the database
         # Apply any other scripts, i.e. repeatable scripts, irrespective of the most recent change in the database
@@ -142,6 +148,7 @@ def deploy(config: DeployConfig, session: SnowflakeSession):
         session.apply_change_script(
             script=script,
             script_content=content,
+            checksum=checksum_current,
             dry_run=config.dry_run,
             logger=script_log,
         )
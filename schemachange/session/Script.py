@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import dataclasses
+import hashlib
 import re
 from abc import ABC
 from pathlib import Path
@@ -16,6 +17,11 @@ import structlog
 logger = structlog.getLogger(__name__)
 T = TypeVar("T", bound="Script")
 
+sql_pattern = re.compile(r"\.sql(\.jinja)?$", flags=re.IGNORECASE)
+
+# Number of characters encoded and hashed at a time by get_checksum
+CHECKSUM_CHUNK_SIZE = 64 * 1024
+
 
 @dataclasses.dataclass(frozen=True)
 class Script(ABC):
@@ -94,11 +100,22 @@ def script_factory(
     logger.debug("ignoring non-change file", file_path=str(file_path))
 
 
+def get_checksum(content: str) -> str:
+    """
+    Returns the checksum of the rendered script content, as recorded in the change history table.
+
+    The content is encoded in chunks, so large scripts are never copied in full to bytes.
+    """
+    checksum = hashlib.sha224()
+    for start in range(0, len(content), CHECKSUM_CHUNK_SIZE):
+        checksum.update(content[start : start + CHECKSUM_CHUNK_SIZE].encode("utf-8"))
+    return checksum.hexdigest()
+
+
 def get_all_scripts_recursively(root_directory: Path):
     all_files: dict[str, T] = dict()
-    all_versions = list()
+    all_versions: set[str] = set()
     # Walk the entire directory structure recursively
-    sql_pattern = re.compile(r"\.sql(\.jinja)?$", flags=re.IGNORECASE)
     file_paths = root_directory.glob("**/*")
     for file_path in file_paths:
         if file_path.is_dir():
@@ -126,6 +143,6 @@ def get_all_scripts_recursively(root_directory: Path):
                     f"The script version {script.version} exists more than once "
                     f"(second instance {str(script.file_path)})"
                 )
-            all_versions.append(script.version)
+            all_versions.add(script.version)
 
     return all_files
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import hashlib
 import time
 from collections import defaultdict
 from textwrap import dedent, indent
@@ -304,6 +303,7 @@ class SnowflakeSession:
         self,
         script: VersionedScript | RepeatableScript | AlwaysScript,
         script_content: str,
+        checksum: str,
         dry_run: bool,
         logger: structlog.BoundLogger,
     ) -> None:
@@ -312,8 +312,6 @@ class SnowflakeSession:
             return
         logger.info("Applying change script")
         # Define a few other change related variables
-        # noinspection PyTypeChecker
-        checksum = hashlib.sha224(script_content.encode("utf-8")).hexdigest()
         execution_time = 0
         status = "Success"
 
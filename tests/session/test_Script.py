@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 from pathlib import Path
 
 import pytest
@@ -11,6 +12,8 @@ from schemachange.session.Script import (
     AlwaysScript,
     script_factory,
     get_all_scripts_recursively,
+    get_checksum,
+    CHECKSUM_CHUNK_SIZE,
 )
 
 
@@ -100,6 +103,19 @@ class TestScript:
         assert result == expected
 
 
+@pytest.mark.parametrize(
+    "content",
+    [
+        "",
+        "SELECT 1",
+        "SELECT 'ünïcødé'" * CHECKSUM_CHUNK_SIZE,
+    ],
+)
+def test_get_checksum_matches_sha224_of_encoded_content(content: str):
+    expected = hashlib.sha224(content.encode("utf-8")).hexdigest()
+    assert get_checksum(content) == expected
+
+
 class TestGetAllScriptsRecursively:
     def test_given_empty_folder_should_return_empty(self, fs):
         root_directory = Path("some_path")
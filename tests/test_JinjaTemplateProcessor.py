@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import errno
 import json
 import os
 import pathlib
+import tempfile
+from unittest import mock
 
+import jinja2
 import pytest
-from jinja2 import DictLoader
+from jinja2 import DictLoader, Template
 from jinja2.exceptions import UndefinedError
 
 from schemachange.JinjaTemplateProcessor import JinjaTemplateProcessor
@@ -51,6 +55,24 @@ class TestJinjaTemplateProcessor:
 
         assert context == "Hello world!"
 
+    @pytest.mark.parametrize(
+        "template, expected",
+        [
+            ("SELECT 1;\r\nSELECT 2;\r\n", "SELECT 1;\nSELECT 2"),
+            ("SELECT 1;\rSELECT 2;\n\n", "SELECT 1;\nSELECT 2"),
+            ("  SELECT '{ not jinja }'\n", "SELECT '{ not jinja }'"),
+        ],
+    )
+    def test_render_without_jinja_markers_matches_jinja_output(
+        self, processor: JinjaTemplateProcessor, template: str, expected: str
+    ):
+        processor.override_loader(DictLoader({"test.sql": template}))
+
+        context = processor.render("test.sql", None)
+
+        assert Template(template).render().strip().rstrip(";") == expected
+        assert context == expected
+
     def test_render_from_subfolder(self, tmp_path: pathlib.Path):
         root_folder = tmp_path / "MORE2"
 
@@ -67,6 +89,76 @@ class TestJinjaTemplateProcessor:
 
         assert context == "Hello world!"
 
+    def test_render_with_bytecode_cache(
+        self, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        temp_dir = tmp_path / "tmp"
+        temp_dir.mkdir()
+        monkeypatch.setattr(tempfile, "tempdir", str(temp_dir))
+        root_folder = tmp_path / "scripts"
+        root_folder.mkdir()
+        script_file = root_folder / "1.0.0_my_test.sql"
+        script_file.write_text("Hello {{ myvar }}!")
+
+        processor = JinjaTemplateProcessor(
+            root_folder, None, use_bytecode_cache=True, schemachange_version="1.2.3"
+        )
+        context = processor.render(processor.relpath(script_file), {"myvar": "world"})
+
+        assert context == "Hello world!"
+        assert (
+            len(list(temp_dir.glob("_jinja2-cache-*/__schemachange_1.2.3_*.cache")))
+            == 1
+        )
+
+        # A new processor loads the cached bytecode instead of compiling the template
+        processor = JinjaTemplateProcessor(
+            root_folder, None, use_bytecode_cache=True, schemachange_version="1.2.3"
+        )
+        with mock.patch.object(
+            jinja2.Environment, "compile", side_effect=AssertionError("compiled")
+        ):
+            context = processor.render(
+                processor.relpath(script_file), {"myvar": "world"}
+            )
+
+        assert context == "Hello world!"
+
+    def test_render_with_unusable_bytecode_cache_directory(
+        self, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path / "does_not_exist"))
+        script_file = tmp_path / "1.0.0_my_test.sql"
+        script_file.write_text("Hello {{ myvar }}!")
+
+        processor = JinjaTemplateProcessor(tmp_path, None, use_bytecode_cache=True)
+        context = processor.render(processor.relpath(script_file), {"myvar": "world"})
+
+        assert context == "Hello world!"
+
+    def test_render_when_bytecode_cache_write_fails(
+        self, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        temp_dir = tmp_path / "tmp"
+        temp_dir.mkdir()
+        monkeypatch.setattr(tempfile, "tempdir", str(temp_dir))
+        root_folder = tmp_path / "scripts"
+        root_folder.mkdir()
+        script_file = root_folder / "1.0.0_my_test.sql"
+        script_file.write_text("Hello {{ myvar }}!")
+
+        processor = JinjaTemplateProcessor(root_folder, None, use_bytecode_cache=True)
+        with mock.patch(
+            "tempfile.NamedTemporaryFile",
+            side_effect=OSError(errno.ENOSPC, "No space left on device"),
+        ):
+            context = processor.render(
+                processor.relpath(script_file), {"myvar": "world"}
+            )
+
+        assert context == "Hello world!"
+        assert list(temp_dir.glob("_jinja2-cache-*/*.cache")) == []
+
     def test_from_environ_not_set(self, processor: JinjaTemplateProcessor):
         # overide the default loader
         templates = {"test.sql": "some text {{ env_var('MYVAR') }}"}
@@ -1,11 +1,16 @@
 from dataclasses import asdict
+from pathlib import Path
 
 import pytest
 
-from schemachange.cli import SCHEMACHANGE_VERSION, SNOWFLAKE_APPLICATION_NAME
+from schemachange.cli import (
+    SCHEMACHANGE_VERSION,
+    SNOWFLAKE_APPLICATION_NAME,
+    _get_jinja_processor,
+)
 from schemachange.config.ChangeHistoryTable import ChangeHistoryTable
 from schemachange.config.utils import get_snowflake_identifier_string
-from schemachange.deploy import alphanum_convert, get_alphanum_key, sorted_alphanumeric
+from schemachange.deploy import get_alphanum_key
 
 
 def test_cli_given__schemachange_version_change_updated_in_setup_config_file():
@@ -19,12 +24,16 @@ def test_cli_given__constants_exist():
     assert SNOWFLAKE_APPLICATION_NAME == "schemachange"
 
 
-def test_alphanum_convert_given__integer():
-    assert alphanum_convert("123") == 123
-
+def test_get_jinja_processor_given__same_folders_returns_cached_processor():
+    processor = _get_jinja_processor(project_root=Path("."), modules_folder=None)
 
-def test_alphanum_convert_given__lowercase():
-    assert alphanum_convert("TEST") == "test"
+    assert (
+        _get_jinja_processor(project_root=Path("."), modules_folder=None) is processor
+    )
+    assert (
+        _get_jinja_processor(project_root=Path("demo"), modules_folder=None)
+        is not processor
+    )
 
 
 def test_get_alphanum_key_given__empty_string():
@@ -59,13 +68,6 @@ def test_get_alphanum_key_given__valid_version_string():
     assert get_alphanum_key("1.2.2") == ["", 1, ".", 2, ".", 2, ""]
 
 
-def test_sorted_alphanumeric_mixed_string():
-    assert sorted_alphanumeric(["V1.2.3__file.sql", "V1.2.4__file.sql"]) == [
-        "V1.2.3__file.sql",
-        "V1.2.4__file.sql",
-    ]
-
-
 @pytest.mark.parametrize(
     "cht, expected",
     [
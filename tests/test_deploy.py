@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import hashlib
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from schemachange.config.DeployConfig import DeployConfig
+from schemachange.deploy import deploy
+
+
+def checksum(content: str) -> str:
+    return hashlib.sha224(content.encode("utf-8")).hexdigest()
+
+
+@pytest.fixture(autouse=True)
+def temp_dir(tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch):
+    # Keep the Jinja bytecode cache out of the real temp directory
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path_factory.mktemp("tmp")))
+
+
+@pytest.fixture
+def root_folder(tmp_path: Path) -> Path:
+    (tmp_path / "V1.10.0__later.sql").write_text("SELECT {{ var1 }};")
+    (tmp_path / "V1.2.0__earlier.sql").write_text("SELECT 2;")
+    (tmp_path / "R__view.sql").write_text("SELECT 'view'")
+    (tmp_path / "A__always.sql").write_text("SELECT 'always'")
+    return tmp_path
+
+
+@pytest.fixture
+def session() -> mock.MagicMock:
+    session = mock.MagicMock()
+    session.get_script_metadata.return_value = ({}, {}, None)
+    return session
+
+
+def get_config(root_folder: Path) -> DeployConfig:
+    return DeployConfig.factory(
+        config_file_path=root_folder / "schemachange-config.yml",
+        root_folder=root_folder,
+        config_vars={"var1": "1"},
+    )
+
+
+def applied(session: mock.MagicMock) -> list[tuple[str, str]]:
+    return [
+        (call.kwargs["script"].name, call.kwargs["script_content"])
+        for call in session.apply_change_script.call_args_list
+    ]
+
+
+class TestDeploy:
+    def test_applies_scripts_in_order(self, root_folder: Path, session: mock.MagicMock):
+        deploy(
+            config=get_config(root_folder),
+            session=session,
+            schemachange_version="1.2.3",
+        )
+
+        assert applied(session) == [
+            ("V1.2.0__earlier.sql", "SELECT 2"),
+            ("V1.10.0__later.sql", "SELECT 1"),
+            ("R__view.sql", "SELECT 'view'"),
+            ("A__always.sql", "SELECT 'always'"),
+        ]
+
+    def test_skips_applied_and_unchanged_scripts(
+        self, root_folder: Path, session: mock.MagicMock
+    ):
+        session.get_script_metadata.return_value = (
+            {"V1.2.0__earlier.sql": {"checksum": checksum("SELECT 2")}},
+            {"R__view.sql": [checksum("SELECT 'view'")]},
+            "1.2.0",
+        )
+
+        deploy(
+            config=get_config(root_folder),
+            session=session,
+            schemachange_version="1.2.3",
+        )
+
+        assert applied(session) == [
+            ("V1.10.0__later.sql", "SELECT 1"),
+            ("A__always.sql", "SELECT 'always'"),
+        ]
+
+    def test_passes_content_checksum_to_session(
+        self, root_folder: Path, session: mock.MagicMock
+    ):
+        deploy(
+            config=get_config(root_folder),
+            session=session,
+            schemachange_version="1.2.3",
+        )
+
+        for call in session.apply_change_script.call_args_list:
+            assert call.kwargs["checksum"] == checksum(call.kwargs["script_content"])
+
+    def test_skips_script_names_not_starting_with_a_script_type(
+        self, root_folder: Path, session: mock.MagicMock
+    ):
+        (root_folder / " V1.3.0__leading_space.sql").write_text("SELECT 3")
+
+        deploy(
+            config=get_config(root_folder),
+            session=session,
+            schemachange_version="1.2.3",
+        )
+
+        assert [name for name, _ in applied(session)] == [
+            "V1.2.0__earlier.sql",
+            "V1.10.0__later.sql",
+            "R__view.sql",
+            "A__always.sql",
+        ]
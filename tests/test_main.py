@@ -71,7 +71,7 @@ script_path = (
 )
 
 no_command = pytest.param(
-    "schemachange.cli.deploy",
+    "schemachange.deploy.deploy",
     ["schemachange", *required_args],
     {**default_deploy_config, **required_config},
     None,
@@ -79,7 +79,7 @@ no_command = pytest.param(
 )
 
 deploy_only_required = pytest.param(
-    "schemachange.cli.deploy",
+    "schemachange.deploy.deploy",
     ["schemachange", "deploy", *required_args],
     {**default_deploy_config, **required_config},
     None,
@@ -87,7 +87,7 @@ deploy_only_required = pytest.param(
 )
 
 deploy_all_cli_arg_names = pytest.param(
-    "schemachange.cli.deploy",
+    "schemachange.deploy.deploy",
     [
         "schemachange",
         "deploy",
@@ -168,7 +168,7 @@ deploy_all_cli_arg_names = pytest.param(
 )
 
 deploy_all_cli_arg_flags = pytest.param(
-    "schemachange.cli.deploy",
+    "schemachange.deploy.deploy",
     [
         "schemachange",
         "deploy",
@@ -249,7 +249,7 @@ deploy_all_cli_arg_flags = pytest.param(
 )
 
 deploy_all_env_all_cli = pytest.param(
-    "schemachange.cli.deploy",
+    "schemachange.deploy.deploy",
     [
         "schemachange",
         "deploy",
@@ -330,7 +330,7 @@ deploy_all_env_all_cli = pytest.param(
 )
 
 deploy_snowflake_oauth_env_var = pytest.param(
-    "schemachange.cli.deploy",
+    "schemachange.deploy.deploy",
     [
         "schemachange",
         "deploy",
@@ -348,7 +348,7 @@ deploy_snowflake_oauth_env_var = pytest.param(
 )
 
 deploy_snowflake_oauth_file = pytest.param(
-    "schemachange.cli.deploy",
+    "schemachange.deploy.deploy",
     [
         "schemachange",
         "deploy",
@@ -449,7 +449,7 @@ def test_main_deploy_subcommand_given_arguments_make_sure_arguments_set_on_call(
     "to_mock, args,  expected_config, expected_script_path",
     [
         (
-            "schemachange.cli.deploy",
+            "schemachange.deploy.deploy",
             [
                 "schemachange",
                 "deploy",
@@ -525,7 +525,7 @@ def test_main_deploy_config_folder(
     "to_mock, args, expected_config, expected_script_path",
     [
         (
-            "schemachange.cli.deploy",
+            "schemachange.deploy.deploy",
             ["schemachange", "deploy", *required_args, "--modules-folder", "DUMMY"],
             {**default_deploy_config, **required_config, "modules_folder": "DUMMY"},
             None,